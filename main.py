@@ -7,8 +7,9 @@ AI 기반 녹취록 자동 요약 및 정리 시스템
 
 import os
 import sys
+import asyncio
 from pathlib import Path
-from transcript_summarizer import TranscriptSummarizer, API_MODES
+from transcript_summarizer import TranscriptSummarizer, API_MODES, DEFAULT_PROMPT
 
 def print_banner():
     """프로그램 배너 출력"""
@@ -30,6 +31,7 @@ def get_api_mode() -> str:
             print(f"{i}. {config['display_name']}")
             print(f"   모델: {config['model_name']}")
             print(f"   요청 간 대기시간: {config['delay_seconds']}초")
+            print(f"   동시 요청 수: {config['concurrency']}")
             print()
 
         choice = input(f"선택 (1-{len(mode_list)}): ").strip()
@@ -55,11 +57,9 @@ def get_custom_prompt() -> str:
     print()
 
     # 기본 프롬프트 예시 표시
-    default_prompt = """너는 뛰어난 회의록 정리자라고 하자. 주어진 txt 파일은 회의 '녹취록'이다. 아주 상세하고도 MECE하게 정리해 주길 부탁한다. 단, 타임스탬프는 제거한다. 단, 테이블로 표현하지 않는다."""
-
     print("기본 프롬프트 예시:")
     print("-" * 40)
-    print(default_prompt)
+    print(DEFAULT_PROMPT)
     print("-" * 40)
     print()
 
@@ -165,6 +165,7 @@ def confirm_settings(api_mode: str, input_folder: Path, output_folder: Path, cus
     print(f"API 모드: {mode_config['display_name']}")
     print(f"사용 모델: {mode_config['model_name']}")
     print(f"요청 간 대기시간: {mode_config['delay_seconds']}초")
+    print(f"동시 요청 수: {mode_config['concurrency']}")
     print(f"입력 폴더: {input_folder}")
     print(f"출력 폴더: {output_folder}")
     print(f"프롬프트: {'사용자 정의' if custom_prompt else '기본'}")
@@ -217,7 +218,7 @@ def main():
         summarizer = TranscriptSummarizer(api_mode, custom_prompt)
 
         # 폴더 처리
-        result = summarizer.process_folder(input_folder, output_folder)
+        result = asyncio.run(summarizer.process_folder(input_folder, output_folder))
 
         # 결과 출력
         print()
@@ -229,6 +230,7 @@ def main():
             print(f"총 파일 수: {result['total']}")
             print(f"성공: {result['processed']}")
             print(f"실패: {result['failed']}")
+            print(f"건너뜀 (이미 요약됨): {result['skipped']}")
             print(f"결과 저장 위치: {output_folder}")
         else:
             print(f"오류: {result.get('error', '알 수 없는 오류')}")
@@ -1,27 +1,128 @@
 import os
-import logging
+import re
+import uuid
+import hashlib
+import itertools
 import time
+import asyncio
+import logging
 from pathlib import Path
-from typing import List, Optional
-import google.generativeai as genai
-from dotenv import load_dotenv
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# 필수 라이브러리 설치 확인
+try:
+    import aiofiles
+    import charset_normalizer
+    import orjson
+    import google.generativeai as genai
+    from google.api_core import exceptions as google_exceptions
+    from dotenv import load_dotenv
+except ImportError as e:
+    print(f"필수 라이브러리가 설치되지 않았습니다: {e}")
+    print("필수 라이브러리를 설치하려면 다음 명령어를 실행하세요:")
+    print("pip install -r requirements.txt")
+    raise
 
 # API 모드별 설정
 API_MODES = {
     'free': {
         'model_name': 'gemini-1.5-flash-latest',
         'delay_seconds': 4,
+        'concurrency': 2,
         'display_name': '무료 API (속도 제한)',
         'env_key_name': 'GOOGLE_API_KEY_FREE'
     },
     'paid': {
         'model_name': 'gemini-2.5-flash-preview-05-20',
         'delay_seconds': 0.2,
+        'concurrency': 8,
         'display_name': '유료 API (최대 속도)',
         'env_key_name': 'GOOGLE_API_KEY_PAID'
     }
 }
 
+# 기본 요약 프롬프트
+DEFAULT_PROMPT = """너는 뛰어난 회의록 정리자라고 하자. 주어진 txt 파일은 회의 '녹취록'이다. 아주 상세하고도 MECE하게 정리해 주길 부탁한다. 단, 타임스탬프는 제거한다. 단, 테이블로 표현하지 않는다."""
+
+# 여러 녹취록을 한 번의 요청으로 묶어 요약할 때 사용하는 프롬프트
+BATCH_PROMPT_TEMPLATE = """아래에 여러 개의 녹취록이 "<<<FILE: 파일명>>>" 구분자로 이어져 있다. 각 녹취록을 다음 지시에 따라 서로 독립적으로 요약하고, 결과는 {{"파일명": "요약 내용"}} 형태의 JSON 객체 하나로만 출력한다.
+
+{prompt}"""
+
+# 묶음 요약 기준 (파일 크기, 바이트)
+BATCH_FILE_MAX_SIZE = 20_000  # 이 크기 이하의 짧은 녹취록만 묶음
+BATCH_MAX_SIZE = 200_000  # 한 묶음에 포함되는 녹취록 크기의 합
+# 한 묶음에 포함되는 최대 파일 수 (모든 상세 요약이 하나의 응답 출력 토큰 한도 안에 들어가도록 제한,
+# 예: 무료 모델 출력 한도 8192 토큰 / 파일당 약 1,500 토큰)
+BATCH_MAX_FILES = 5
+
+# 요약 파일 머리말의 토큰 수 표기 폭 (스트리밍 완료 후 같은 자리에 덮어쓰기 위해 고정)
+FRONT_MATTER_VALUE_WIDTH = 10
+
+# 재시도 대기시간 범위 (초)
+RETRY_MIN_SECONDS = 1
+RETRY_MAX_SECONDS = 60
+
+# 재시도해도 성공할 수 없는 HTTP 상태 코드
+NON_RETRYABLE_STATUS_CODES = (400, 401, 403, 404)
+
+def format_front_matter(input_tokens: Optional[int], output_tokens: Optional[int]) -> str:
+    """
+    토큰 사용량을 담은 요약 파일 머리말(YAML front matter) 생성
+
+    Args:
+        input_tokens (Optional[int]): 입력 토큰 수 (알 수 없으면 None)
+        output_tokens (Optional[int]): 출력 토큰 수 (알 수 없으면 None)
+
+    Returns:
+        str: 고정 폭으로 정렬된 머리말 문자열
+    """
+    def field(value: Optional[int]) -> str:
+        return ('null' if value is None else str(value)).rjust(FRONT_MATTER_VALUE_WIDTH)
+
+    return f"---\ninput_tokens: {field(input_tokens)}\noutput_tokens: {field(output_tokens)}\n---\n\n"
+
+def detect_and_decode(raw: bytes) -> Optional[Tuple[str, str]]:
+    """
+    charset_normalizer로 인코딩을 감지하여 디코딩
+
+    Args:
+        raw (bytes): 파일 원본 바이트
+
+    Returns:
+        Optional[Tuple[str, str]]: (디코딩된 내용, 감지된 인코딩), 감지 실패 시 None
+    """
+    best_match = charset_normalizer.from_bytes(raw).best()
+    if best_match is None:
+        return None
+    return str(best_match), best_match.encoding
+
+class RateLimiter:
+    """모든 동시 작업에 걸쳐 요청 간 최소 간격을 보장하는 비동기 속도 제한기"""
+
+    def __init__(self, rps: float):
+        """
+        RateLimiter 초기화
+
+        Args:
+            rps (float): 초당 허용 요청 수
+        """
+        self.interval = 1 / rps
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        # 다음 요청 슬롯을 예약한 뒤, 락 밖에서 해당 시각까지 대기
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
 class TranscriptSummarizer:
     """AI 기반 녹취록 자동 요약 및 정리 시스템"""
 
@@ -39,6 +140,8 @@ class TranscriptSummarizer:
         self.api_mode = api_mode
         self.mode_config = API_MODES[api_mode]
         self.custom_prompt = custom_prompt
+        # 사용자 정의 프롬프트가 있으면 사용, 없으면 기본 프롬프트 사용
+        self._prompt = custom_prompt or DEFAULT_PROMPT
         self.api_key = None
         self.model = None
 
@@ -46,6 +149,26 @@ class TranscriptSummarizer:
         self.total_input_tokens = 0
         self.total_output_tokens = 0
 
+        # 동시 API 요청 수 제한
+        self._sem = asyncio.Semaphore(self.mode_config['concurrency'])
+
+        # 요청 간 최소 간격 보장 (모드별 대기시간 기준)
+        self.rate_limiter = RateLimiter(1 / self.mode_config['delay_seconds'])
+
+        # 출력 파일명에 붙일 태그 (모델명의 특수문자 제거)
+        model_name_clean = self.mode_config['model_name'].replace('-', '_').replace('.', '_')
+        self._summary_tag = f"_summary_{model_name_clean}"
+
+        # 묶음당 최대 파일 수 (응답이 출력 토큰 한도에서 잘리면 실행 중 줄어듦)
+        self._batch_max_files = BATCH_MAX_FILES
+
+        # 이미 생성된 출력 디렉토리 (파일마다 mkdir 호출 방지)
+        self._known_dirs = set()
+
+        # 요약 결과 캐시 디렉토리 (동일한 모델/프롬프트/내용은 API 재호출 없이 재사용)
+        self.cache_dir = Path("logs/.cache")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
         self.setup_logging()
         self.load_api_key()
         self.initialize_gemini()
@@ -88,18 +211,6 @@ class TranscriptSummarizer:
             self.logger.error(f"Gemini API 초기화 실패: {e}")
             raise
 
-    def check_dependencies(self) -> bool:
-        """필수 라이브러리 설치 확인"""
-        try:
-            import google.generativeai
-            import dotenv
-            return True
-        except ImportError as e:
-            self.logger.error(f"필수 라이브러리가 설치되지 않았습니다: {e}")
-            print("필수 라이브러리를 설치하려면 다음 명령어를 실행하세요:")
-            print("pip install -r requirements.txt")
-            return False
-
     def find_txt_files(self, input_folder: Path) -> List[Path]:
         """
         입력 폴더에서 모든 .txt 파일을 재귀적으로 찾기
@@ -110,17 +221,39 @@ class TranscriptSummarizer:
         Returns:
             List[Path]: 찾은 .txt 파일들의 경로 리스트
         """
-        txt_files = []
         try:
-            for file_path in input_folder.rglob("*.txt"):
-                txt_files.append(file_path)
+            txt_files = list(self._walk_txt_files(input_folder))
             self.logger.info(f"총 {len(txt_files)}개의 .txt 파일을 발견했습니다.")
             return txt_files
         except Exception as e:
             self.logger.error(f"파일 검색 중 오류 발생: {e}")
             raise
 
-    def read_file_content(self, file_path: Path) -> str:
+    def _walk_txt_files(self, directory: Path) -> Iterator[Path]:
+        """
+        os.scandir 기반 재귀 탐색 (.txt 파일에 대해서만 Path 생성)
+
+        Args:
+            directory (Path): 탐색할 폴더 경로
+
+        Yields:
+            Path: 찾은 .txt 파일 경로
+        """
+        try:
+            entries = os.scandir(directory)
+        except OSError as e:
+            # 접근 권한이 없는 폴더 등은 건너뜀 (예: System Volume Information)
+            self.logger.warning("폴더를 읽을 수 없어 건너뜁니다 (%s): %s", directory, e)
+            return
+
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from self._walk_txt_files(entry.path)
+                elif os.path.normcase(entry.name).endswith('.txt'):
+                    yield Path(entry.path)
+
+    async def read_file_content(self, file_path: Path) -> str:
         """
         텍스트 파일 내용 읽기 (인코딩 문제 해결)
 
@@ -132,81 +265,352 @@ class TranscriptSummarizer:
         """
         encodings = ['utf-8', 'cp949', 'euc-kr']
 
+        # 파일은 한 번만 읽고, 인코딩 판별은 메모리에서 수행
+        try:
+            async with aiofiles.open(file_path, 'rb') as f:
+                raw = await f.read()
+        except Exception as e:
+            self.logger.error("파일 읽기 오류 (%s): %s", file_path, e)
+            raise
+
         for encoding in encodings:
             try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    content = f.read()
-                self.logger.debug(f"파일 {file_path}을 {encoding} 인코딩으로 성공적으로 읽었습니다.")
+                content = raw.decode(encoding)
+                self.logger.debug("파일 %s을 %s 인코딩으로 성공적으로 읽었습니다.", file_path, encoding)
                 return content
             except UnicodeDecodeError:
                 continue
-            except Exception as e:
-                self.logger.error(f"파일 읽기 오류 ({file_path}): {e}")
-                raise
 
-        raise UnicodeDecodeError(f"파일 {file_path}을 읽을 수 없습니다. 지원되는 인코딩을 모두 시도했습니다.")
+        # 지원 인코딩으로 읽을 수 없으면 인코딩 자동 감지
+        # 감지 중 이벤트 루프가 멈추지 않도록 스레드에서 실행
+        detected = await asyncio.to_thread(detect_and_decode, raw)
+        if detected is not None:
+            content, encoding = detected
+            self.logger.debug("파일 %s을 감지된 %s 인코딩으로 읽었습니다.", file_path, encoding)
+            return content
+
+        raise ValueError(f"파일 {file_path}을 읽을 수 없습니다. 지원되는 인코딩을 모두 시도했습니다.")
+
+    def get_cache_path(self, content: str) -> Path:
+        """
+        모델명, 프롬프트, 내용의 SHA-256 해시로 캐시 파일 경로 계산
+
+        Args:
+            content (str): 요약할 텍스트 내용
+
+        Returns:
+            Path: 캐시 파일 경로
+        """
+        key = hashlib.sha256()
+        for part in (self.mode_config['model_name'], self._prompt, content):
+            key.update(part.encode('utf-8'))
+            key.update(b"\0")
+        return self.cache_dir / key.hexdigest()
 
-    def summarize_text(self, content: str, max_retries: int = 3) -> str:
+    async def summarize_text(self, content: str, output_path: Path, max_retries: int = 3) -> str:
         """
-        AI를 사용하여 텍스트 요약
+        AI를 사용하여 텍스트 요약 (응답을 스트리밍으로 받아 도착하는 대로 파일에 저장)
 
         Args:
             content (str): 요약할 텍스트 내용
+            output_path (Path): 요약 결과를 저장할 파일 경로
             max_retries (int): 최대 재시도 횟수
 
         Returns:
             str: 요약된 텍스트
         """
-        # 사용자 정의 프롬프트가 있으면 사용, 없으면 기본 프롬프트 사용
-        if self.custom_prompt:
-            prompt = self.custom_prompt
-        else:
-            prompt = """너는 뛰어난 회의록 정리자라고 하자. 주어진 txt 파일은 회의 '녹취록'이다. 아주 상세하고도 MECE하게 정리해 주길 부탁한다. 단, 타임스탬프는 제거한다. 단, 테이블로 표현하지 않는다."""
+        # 캐시된 요약이 있으면 API 호출 없이 저장
+        cache_path = self.get_cache_path(content)
+        summary = await self.read_cache(cache_path)
+        if summary is not None:
+            await self.save_summary(summary, output_path)
+            return summary
+
+        # 스트리밍 중에는 임시 파일에 기록하고, 완료 후 최종 경로로 이동
+        self.ensure_dir(output_path.parent)
+        partial_path = output_path.with_name(output_path.name + ".part")
 
         for attempt in range(max_retries):
             try:
-                # API 모드에 따른 딜레이 적용
-                if attempt > 0:  # 첫 번째 시도가 아닌 경우에만 딜레이 적용
-                    delay_time = self.mode_config['delay_seconds']
-                    self.logger.info(f"API 속도 제한을 위해 {delay_time}초 대기 중...")
-                    time.sleep(delay_time)
+                # API 모드에 따른 요청 간격 적용
+                async with self.rate_limiter:
+                    response = await self.model.generate_content_async([self._prompt, "\n\n", content], stream=True)
+
+                # 머리말 자리를 먼저 확보한 뒤 요약 내용을 스트리밍으로 기록하고,
+                # 스트림 종료 후 같은 파일 핸들에서 토큰 사용량으로 머리말을 덮어씀
+                chunks = []
+                async with aiofiles.open(partial_path, 'w', encoding='utf-8') as f:
+                    await f.write(format_front_matter(None, None))
+                    async for chunk in response:
+                        if not chunk.parts:
+                            continue
+                        await f.write(chunk.text)
+                        chunks.append(chunk.text)
+                    summary = "".join(chunks)
+
+                    if not summary:
+                        raise Exception("API 응답이 비어있습니다.")
+
+                    # 토큰 사용량 로깅 및 누적 (스트림 종료 후 집계된 값 사용)
+                    input_tokens, output_tokens = self.log_token_usage(response)
+                    await f.seek(0)
+                    await f.write(format_front_matter(input_tokens, output_tokens))
+
+                os.replace(partial_path, output_path)
+                self.logger.info("요약 결과 저장 완료: %s", output_path)
+
+                await self.write_cache(cache_path, summary)
+                return summary
+
+            except Exception as e:
+                # 중단된 스트리밍의 임시 파일 정리
+                partial_path.unlink(missing_ok=True)
+                await self.wait_before_retry(e, attempt, max_retries)
+
+    async def summarize_batch(self, contents: Dict[str, str], max_retries: int = 3) -> Dict[str, str]:
+        """
+        여러 개의 짧은 녹취록을 한 번의 API 요청으로 요약
+
+        Args:
+            contents (Dict[str, str]): 파일명별 녹취록 내용
+            max_retries (int): 최대 재시도 횟수
+
+        Returns:
+            Dict[str, str]: 파일명별 요약 결과 (응답을 해석할 수 없으면 빈 딕셔너리)
+        """
+        prompt_parts = [BATCH_PROMPT_TEMPLATE.format(prompt=self._prompt)]
+        for name, content in contents.items():
+            prompt_parts.append(f"\n\n<<<FILE: {name}>>>\n")
+            prompt_parts.append(content)
 
-                response = self.model.generate_content(prompt + "\n\n" + content)
+        for attempt in range(max_retries):
+            try:
+                # API 모드에 따른 요청 간격 적용
+                async with self.rate_limiter:
+                    response = await self.model.generate_content_async(prompt_parts)
                 if response.text:
-                                        # 토큰 사용량 로깅 및 누적
-                    try:
-                        if hasattr(response, 'usage_metadata') and response.usage_metadata:
-                            input_tokens = getattr(response.usage_metadata, 'prompt_token_count', 0)
-                            output_tokens = getattr(response.usage_metadata, 'candidates_token_count', 0)
-                            total_tokens = getattr(response.usage_metadata, 'total_token_count', 0)
-
-                            # 토큰 사용량 누적
-                            self.total_input_tokens += input_tokens
-                            self.total_output_tokens += output_tokens
-
-                            self.logger.info(f"토큰 사용량 - 입력: {input_tokens}, 출력: {output_tokens}, 총합: {total_tokens} (모델: {self.mode_config['model_name']})")
-                        else:
-                            self.logger.info(f"토큰 사용량 정보를 가져올 수 없습니다. (모델: {self.mode_config['model_name']})")
-                    except Exception as token_error:
-                        self.logger.warning(f"토큰 사용량 로깅 실패: {token_error}")
-
-                    return response.text
+                    self.log_token_usage(response)
+                    break
                 else:
                     raise Exception("API 응답이 비어있습니다.")
 
             except Exception as e:
-                self.logger.warning(f"API 요청 실패 (시도 {attempt + 1}/{max_retries}): {e}")
-                if attempt < max_retries - 1:
-                    # 재시도 시 추가 딜레이 (지수 백오프 + 모드별 기본 딜레이)
-                    retry_delay = (2 ** attempt) + self.mode_config['delay_seconds']
-                    self.logger.info(f"재시도를 위해 {retry_delay}초 대기 중...")
-                    time.sleep(retry_delay)
-                else:
-                    raise Exception(f"API 요청이 {max_retries}회 시도 후 실패했습니다: {e}")
+                await self.wait_before_retry(e, attempt, max_retries)
+
+        # 출력 토큰 한도에서 잘린 응답은 JSON으로 해석할 수 없으므로 이후 묶음 크기를 줄임
+        if self.is_truncated(response):
+            self._batch_max_files = min(self._batch_max_files, len(contents) // 2)
+            if self._batch_max_files < 2:
+                self.logger.warning("묶음 요약 응답이 출력 토큰 한도(MAX_TOKENS)에서 잘렸습니다. 이후에는 묶음 요약을 사용하지 않습니다.")
+            else:
+                self.logger.warning("묶음 요약 응답이 출력 토큰 한도(MAX_TOKENS)에서 잘렸습니다. 이후 묶음당 최대 파일 수: %d개", self._batch_max_files)
+            return {}
+
+        return self.parse_batch_response(response.text, contents.keys())
+
+    def is_truncated(self, response) -> bool:
+        """
+        응답이 출력 토큰 한도에 도달하여 중간에 끝났는지 확인
+
+        Args:
+            response: Gemini API 응답
+
+        Returns:
+            bool: 응답 종료 사유가 MAX_TOKENS이면 True
+        """
+        try:
+            finish_reason = response.candidates[0].finish_reason
+        except (AttributeError, IndexError):
+            return False
+        return getattr(finish_reason, 'name', str(finish_reason)) == 'MAX_TOKENS'
+
+    def parse_batch_response(self, text: str, names: Iterable[str]) -> Dict[str, str]:
+        """
+        묶음 요약 응답(JSON)을 파일명별 요약 결과로 변환
+
+        Args:
+            text (str): API 응답 텍스트
+            names (Iterable[str]): 요청에 포함된 파일명 목록
+
+        Returns:
+            Dict[str, str]: 파일명별 요약 결과 (해석 실패 시 빈 딕셔너리)
+        """
+        # 코드 블록(```json ... ```)으로 감싼 응답 처리
+        text = text.strip()
+        if text.startswith("```"):
+            text = text.split("\n", 1)[-1].rsplit("```", 1)[0]
+
+        try:
+            data = orjson.loads(text)
+        except ValueError as e:
+            self.logger.warning("묶음 요약 응답을 해석할 수 없습니다: %s", e)
+            return {}
+
+        if not isinstance(data, dict):
+            self.logger.warning("묶음 요약 응답이 JSON 객체가 아닙니다.")
+            return {}
 
-    def save_summary(self, summary: str, output_path: Path):
+        return {name: data[name] for name in names if isinstance(data.get(name), str) and data[name]}
+
+    def log_token_usage(self, response) -> Tuple[Optional[int], Optional[int]]:
         """
-        요약 결과를 파일로 저장
+        API 응답의 토큰 사용량 로깅 및 누적
+
+        Args:
+            response: Gemini API 응답
+
+        Returns:
+            Tuple[Optional[int], Optional[int]]: 입력/출력 토큰 수 (알 수 없으면 None)
+        """
+        try:
+            if hasattr(response, 'usage_metadata') and response.usage_metadata:
+                input_tokens = getattr(response.usage_metadata, 'prompt_token_count', 0)
+                output_tokens = getattr(response.usage_metadata, 'candidates_token_count', 0)
+                total_tokens = getattr(response.usage_metadata, 'total_token_count', 0)
+
+                # 토큰 사용량 누적
+                self.total_input_tokens += input_tokens
+                self.total_output_tokens += output_tokens
+
+                self.logger.info("토큰 사용량 - 입력: %s, 출력: %s, 총합: %s (모델: %s)",
+                                 input_tokens, output_tokens, total_tokens, self.mode_config['model_name'])
+                return input_tokens, output_tokens
+            else:
+                self.logger.info("토큰 사용량 정보를 가져올 수 없습니다. (모델: %s)", self.mode_config['model_name'])
+        except Exception as token_error:
+            self.logger.warning("토큰 사용량 로깅 실패: %s", token_error)
+        return None, None
+
+    async def read_cache(self, cache_path: Path) -> Optional[str]:
+        """
+        캐시된 요약 결과 읽기
+
+        Args:
+            cache_path (Path): 캐시 파일 경로
+
+        Returns:
+            Optional[str]: 캐시된 요약 내용, 캐시가 없거나 비어 있으면 None
+        """
+        try:
+            async with aiofiles.open(cache_path, 'r', encoding='utf-8') as f:
+                summary = await f.read()
+        except FileNotFoundError:
+            return None
+
+        # 이전 버전에서 중단된 기록으로 남은 빈 캐시는 없는 것으로 처리
+        if not summary:
+            return None
+
+        self.logger.info("캐시된 요약 결과를 사용합니다: %s", cache_path.name)
+        return summary
+
+    async def write_cache(self, cache_path: Path, summary: str):
+        """
+        요약 결과 캐시 저장 (실패해도 처리는 계속 진행)
+        임시 파일에 기록한 뒤 이동하므로 중단되더라도 불완전한 캐시가 남지 않음
+
+        Args:
+            cache_path (Path): 캐시 파일 경로
+            summary (str): 저장할 요약 내용
+        """
+        # 같은 내용의 파일이 동시에 처리되어도 서로의 임시 파일을 덮어쓰지 않도록 고유한 이름 사용
+        temp_path = cache_path.with_name(f"{cache_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            async with aiofiles.open(temp_path, 'w', encoding='utf-8') as f:
+                await f.write(summary)
+            os.replace(temp_path, cache_path)
+        except Exception as cache_error:
+            temp_path.unlink(missing_ok=True)
+            self.logger.warning("요약 결과 캐시 저장 실패: %s", cache_error)
+
+    async def wait_before_retry(self, error: Exception, attempt: int, max_retries: int):
+        """
+        API 요청 실패 시 오류 유형에 따라 재시도 대기 또는 예외 발생
+
+        Args:
+            error (Exception): API 요청 중 발생한 예외
+            attempt (int): 현재 시도 번호 (0부터 시작)
+            max_retries (int): 최대 재시도 횟수
+        """
+        self.logger.warning("API 요청 실패 (시도 %d/%d): %s", attempt + 1, max_retries, error)
+        error_type = self.classify_api_error(error)
+
+        # 인증 오류, 잘못된 요청 등은 재시도하지 않음
+        if error_type == "fatal":
+            raise Exception(f"API 요청이 재시도할 수 없는 오류로 실패했습니다: {error}")
+
+        if attempt >= max_retries - 1:
+            raise Exception(f"API 요청이 {max_retries}회 시도 후 실패했습니다: {error}")
+
+        server_delay = self.get_server_retry_delay(error) if error_type == "quota" else None
+        if server_delay is not None:
+            # 일일 한도 초과 등 대기시간이 너무 길면 동시 요청 슬롯을 붙잡지 않고 바로 실패
+            if server_delay > RETRY_MAX_SECONDS:
+                raise Exception(f"API 요청 한도 초과로 {server_delay:.0f}초 후에 다시 시도해야 합니다: {error}")
+            # 요청 한도 초과 시 서버가 제시한 대기시간 준수
+            retry_delay = max(server_delay, RETRY_MIN_SECONDS)
+        else:
+            # 재시도 시 추가 딜레이 (지수 백오프 + 모드별 기본 딜레이)
+            retry_delay = (2 ** attempt) + self.mode_config['delay_seconds']
+            retry_delay = min(max(retry_delay, RETRY_MIN_SECONDS), RETRY_MAX_SECONDS)
+        self.logger.info("재시도를 위해 %s초 대기 중...", retry_delay)
+        await asyncio.sleep(retry_delay)
+
+    def classify_api_error(self, error: Exception) -> str:
+        """
+        API 오류 유형 분류
+
+        Args:
+            error (Exception): API 요청 중 발생한 예외
+
+        Returns:
+            str: "quota" (요청 한도 초과), "fatal" (재시도 불가), "retry" (일시적 오류)
+        """
+        code = getattr(error, 'code', None)
+        message = str(error).lower()
+
+        if (isinstance(error, google_exceptions.ResourceExhausted) or code == 429
+                or any(keyword in message for keyword in ('quota', 'resource_exhausted', 'rate limit', 'too many requests'))):
+            return "quota"
+        if code in NON_RETRYABLE_STATUS_CODES:
+            return "fatal"
+        return "retry"
+
+    def get_server_retry_delay(self, error: Exception) -> Optional[float]:
+        """
+        요청 한도 초과 오류에서 서버가 제시한 재시도 대기시간 추출
+
+        Args:
+            error (Exception): API 요청 중 발생한 예외
+
+        Returns:
+            Optional[float]: 대기시간(초), 정보가 없으면 None
+        """
+        for detail in getattr(error, 'details', None) or []:
+            retry_delay = getattr(detail, 'retry_delay', None)
+            if retry_delay is not None:
+                return retry_delay.seconds + retry_delay.nanos / 1e9
+
+        # details가 없으면 오류 메시지의 "retry_delay { seconds: N }" 부분에서 추출
+        match = re.search(r"retry_delay\s*\{\s*seconds:\s*(\d+)", str(error))
+        if match:
+            return float(match.group(1))
+        return None
+
+    def ensure_dir(self, directory: Path):
+        """
+        디렉토리 생성 (이미 확인한 디렉토리는 건너뜀)
+
+        Args:
+            directory (Path): 생성할 디렉토리 경로
+        """
+        if directory not in self._known_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(directory)
+
+    async def save_summary(self, summary: str, output_path: Path):
+        """
+        요약 결과를 파일로 저장 (파일별 토큰 사용량을 알 수 없으므로 머리말 값은 null)
 
         Args:
             summary (str): 저장할 요약 내용
@@ -214,18 +618,38 @@ class TranscriptSummarizer:
         """
         try:
             # 출력 디렉토리 생성
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            self.ensure_dir(output_path.parent)
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(summary)
+            async with aiofiles.open(output_path, 'w', encoding='utf-8') as f:
+                await f.write(format_front_matter(None, None))
+                await f.write(summary)
 
-            self.logger.info(f"요약 결과 저장 완료: {output_path}")
+            self.logger.info("요약 결과 저장 완료: %s", output_path)
 
         except Exception as e:
-            self.logger.error(f"파일 저장 오류 ({output_path}): {e}")
+            self.logger.error("파일 저장 오류 (%s): %s", output_path, e)
             raise
 
-    def process_file(self, input_file: Path, input_folder: Path, output_folder: Path) -> bool:
+    def get_output_path(self, input_file: Path, input_folder: Path, output_folder: Path) -> Path:
+        """
+        입력 파일에 대응하는 요약 결과 파일 경로 계산
+
+        Args:
+            input_file (Path): 입력 파일 경로
+            input_folder (Path): 입력 폴더 경로
+            output_folder (Path): 출력 폴더 경로
+
+        Returns:
+            Path: 요약 결과 파일 경로
+        """
+        # 입력 파일의 상대 경로 계산 (입력 폴더 기준)
+        relative_path = input_file.relative_to(input_folder)
+        stem, suffix = relative_path.stem, relative_path.suffix
+
+        # 출력 파일 경로 생성 (폴더 구조 유지, 모델명 포함)
+        return output_folder / relative_path.with_name(f"{stem}{self._summary_tag}{suffix}")
+
+    async def process_file(self, input_file: Path, input_folder: Path, output_folder: Path) -> bool:
         """
         단일 파일 처리
 
@@ -238,45 +662,151 @@ class TranscriptSummarizer:
             bool: 처리 성공 여부
         """
         try:
-            # 입력 파일의 상대 경로 계산 (입력 폴더 기준)
-            relative_path = input_file.relative_to(input_folder)
-
-            # 모델명을 파일명에 포함하기 위해 정리 (특수문자 제거)
-            model_name_clean = self.mode_config['model_name'].replace('-', '_').replace('.', '_')
-
-            # 출력 파일 경로 생성 (폴더 구조 유지, 모델명 포함)
-            output_file = output_folder / relative_path.parent / f"{input_file.stem}_summary_{model_name_clean}{input_file.suffix}"
+            output_file = self.get_output_path(input_file, input_folder, output_folder)
 
             # 파일 내용 읽기
-            content = self.read_file_content(input_file)
-
-            # AI 요약
-            summary = self.summarize_text(content)
+            content = await self.read_file_content(input_file)
 
-            # 결과 저장
-            self.save_summary(summary, output_file)
+            # AI 요약 및 결과 저장
+            await self.summarize_text(content, output_file)
 
             return True
 
         except Exception as e:
-            self.logger.error(f"파일 처리 실패 ({input_file}): {e}")
+            self.logger.error("파일 처리 실패 (%s): %s", input_file, e)
             return False
 
-    def process_folder(self, input_folder: Path, output_folder: Path) -> dict:
+    async def process_batch(self, input_files: List[Path], input_folder: Path, output_folder: Path) -> List[bool]:
         """
-        폴더 내 모든 .txt 파일 처리
+        짧은 파일 여러 개를 한 번의 API 요청으로 묶어 처리
+        (응답에서 요약을 찾지 못한 파일은 개별 요청으로 다시 처리)
 
         Args:
+            input_files (List[Path]): 처리할 입력 파일 경로 리스트
             input_folder (Path): 입력 폴더 경로
             output_folder (Path): 출력 폴더 경로
 
         Returns:
-            dict: 처리 결과 통계
+            List[bool]: 파일별 처리 성공 여부
+        """
+        results = {}
+        pending = {}
+
+        # 파일 내용 읽기 (캐시된 파일은 바로 저장)
+        for input_file in input_files:
+            try:
+                output_file = self.get_output_path(input_file, input_folder, output_folder)
+                content = await self.read_file_content(input_file)
+                cached_summary = await self.read_cache(self.get_cache_path(content))
+                if cached_summary is not None:
+                    await self.save_summary(cached_summary, output_file)
+                    results[input_file] = True
+                else:
+                    name = input_file.relative_to(input_folder).as_posix()
+                    pending[name] = (input_file, content, output_file)
+            except Exception as e:
+                self.logger.error("파일 처리 실패 (%s): %s", input_file, e)
+                results[input_file] = False
+
+        # 묶음 요약 (현재 묶음당 최대 파일 수 기준으로 나누어 요청, 실패 시 개별 요청으로 처리)
+        summaries = {}
+        remaining = list(pending)
+        while len(remaining) > 1 and self._batch_max_files > 1:
+            group, remaining = remaining[:self._batch_max_files], remaining[self._batch_max_files:]
+            if len(group) < 2:
+                break
+
+            try:
+                group_summaries = await self.summarize_batch({name: pending[name][1] for name in group})
+            except Exception as e:
+                self.logger.warning("묶음 요약 실패, 개별 요청으로 처리합니다: %s", e)
+                continue
+
+            # 출력 토큰 한도로 잘린 묶음은 줄어든 묶음 크기로 다시 요청
+            if not group_summaries and self._batch_max_files < len(group):
+                remaining = group + remaining
+                continue
+
+            summaries.update(group_summaries)
+            self.logger.info("묶음 요약 완료: %d/%d개", len(group_summaries), len(group))
+
+        for name, (input_file, content, output_file) in pending.items():
+            try:
+                if name in summaries:
+                    # 묶음 요약은 개별 요약과 프롬프트가 다르므로 캐시에 저장하지 않음
+                    await self.save_summary(summaries[name], output_file)
+                else:
+                    await self.summarize_text(content, output_file)
+                results[input_file] = True
+            except Exception as e:
+                self.logger.error("파일 처리 실패 (%s): %s", input_file, e)
+                results[input_file] = False
+
+        return [results[input_file] for input_file in input_files]
+
+    def needs_processing(self, input_file: Path, input_folder: Path, output_folder: Path) -> bool:
         """
-        # 의존성 확인
-        if not self.check_dependencies():
-            return {"success": False, "error": "필수 라이브러리가 설치되지 않았습니다."}
+        요약이 필요한 파일인지 확인 (요약 결과가 없거나 원본보다 오래된 경우)
 
+        Args:
+            input_file (Path): 입력 파일 경로
+            input_folder (Path): 입력 폴더 경로
+            output_folder (Path): 출력 폴더 경로
+
+        Returns:
+            bool: 요약 필요 여부
+        """
+        output_file = self.get_output_path(input_file, input_folder, output_folder)
+        try:
+            return output_file.stat().st_mtime < input_file.stat().st_mtime
+        except FileNotFoundError:
+            return True
+
+    def build_batches(self, txt_files: List[Path]) -> List[List[Path]]:
+        """
+        파일 크기를 기준으로 처리 단위 구성
+        (짧은 파일은 크기 합이 BATCH_MAX_SIZE 이하, 파일 수가 BATCH_MAX_FILES 이하가 되도록 묶고,
+        긴 파일은 단독 처리)
+
+        Args:
+            txt_files (List[Path]): 처리할 파일 경로 리스트
+
+        Returns:
+            List[List[Path]]: 처리 단위별 파일 경로 리스트
+        """
+        batches = []
+        current_batch = []
+        current_size = 0
+
+        for file_path in txt_files:
+            size = file_path.stat().st_size
+            if size > BATCH_FILE_MAX_SIZE:
+                batches.append([file_path])
+                continue
+
+            if current_batch and (current_size + size > BATCH_MAX_SIZE
+                                  or len(current_batch) >= self._batch_max_files):
+                batches.append(current_batch)
+                current_batch = []
+                current_size = 0
+            current_batch.append(file_path)
+            current_size += size
+
+        if current_batch:
+            batches.append(current_batch)
+        return batches
+
+    async def process_folder(self, input_folder: Path, output_folder: Path) -> dict:
+        """
+        폴더 내 모든 .txt 파일 처리 (API 모드별 동시 요청 수만큼 병렬 처리)
+
+        Args:
+            input_folder (Path): 입력 폴더 경로
+            output_folder (Path): 출력 폴더 경로
+
+        Returns:
+            dict: 처리 결과 통계
+        """
         # 입력 폴더 유효성 검사
         if not input_folder.exists():
             raise ValueError(f"입력 폴더가 존재하지 않습니다: {input_folder}")
@@ -285,37 +815,51 @@ class TranscriptSummarizer:
             raise ValueError(f"입력 경로가 폴더가 아닙니다: {input_folder}")
 
         # 출력 폴더 생성
-        output_folder.mkdir(parents=True, exist_ok=True)
+        self.ensure_dir(output_folder)
 
-        # .txt 파일 찾기
-        txt_files = self.find_txt_files(input_folder)
+        # .txt 파일 찾기 (출력 폴더가 입력 폴더 안에 있으면 요약 결과 파일은 제외)
+        txt_files = [file_path for file_path in self.find_txt_files(input_folder)
+                     if output_folder not in file_path.parents]
 
         if not txt_files:
             self.logger.warning("처리할 .txt 파일을 찾을 수 없습니다.")
-            return {"success": True, "processed": 0, "failed": 0}
+            return {"success": True, "total": 0, "processed": 0, "failed": 0, "skipped": 0}
 
-        # 파일 처리
-        processed_count = 0
-        failed_count = 0
+        # 이미 요약된 파일 제외
+        pending_files = [file_path for file_path in txt_files
+                         if self.needs_processing(file_path, input_folder, output_folder)]
+        skipped_count = len(txt_files) - len(pending_files)
+        if skipped_count:
+            self.logger.info(f"이미 요약된 파일 {skipped_count}개를 건너뜁니다.")
 
-        for i, file_path in enumerate(txt_files, 1):
-            print(f"파일 처리 중... [{i}/{len(txt_files)}] {file_path.name}")
+        # 파일 처리 (짧은 파일은 묶어서 요청, 세마포어로 동시 요청 수 제한)
+        file_counter = itertools.count(1)
 
-            if self.process_file(file_path, input_folder, output_folder):
-                processed_count += 1
-            else:
-                failed_count += 1
+        async def process_with_limit(batch: List[Path]) -> List[bool]:
+            async with self._sem:
+                for file_path in batch:
+                    print(f"파일 처리 중... [{next(file_counter)}/{len(pending_files)}] {file_path.name}")
+                if len(batch) == 1:
+                    return [await self.process_file(batch[0], input_folder, output_folder)]
+                return await self.process_batch(batch, input_folder, output_folder)
+
+        tasks = [process_with_limit(batch) for batch in self.build_batches(pending_files)]
+        results = [ok for batch_results in await asyncio.gather(*tasks) for ok in batch_results]
+
+        processed_count = sum(1 for ok in results if ok)
+        failed_count = len(results) - processed_count
 
         result = {
             "success": True,
             "total": len(txt_files),
             "processed": processed_count,
-            "failed": failed_count
+            "failed": failed_count,
+            "skipped": skipped_count
         }
 
         # 총 토큰 사용량 로깅
         total_tokens = self.total_input_tokens + self.total_output_tokens
-        self.logger.info(f"처리 완료: 총 {len(txt_files)}개, 성공 {processed_count}개, 실패 {failed_count}개")
+        self.logger.info(f"처리 완료: 총 {len(txt_files)}개, 성공 {processed_count}개, 실패 {failed_count}개, 건너뜀 {skipped_count}개")
         self.logger.info(f"전체 토큰 사용량 - 입력: {self.total_input_tokens:,}, 출력: {self.total_output_tokens:,}, 총합: {total_tokens:,} (모델: {self.mode_config['model_name']})")
 
         return result